@@ -79,6 +79,11 @@ async def lifespan(app_instance: FastAPI):
         logging.debug("Cleaned up camera resources successfully.")
     except Exception as e:
         logging.error("Error during cleanup: %s", e)
+    try:
+        from .utils.printer_services._http import close_shared_session
+        close_shared_session()
+    except Exception as e:
+        logging.error("Error closing printer HTTP session: %s", e)
 
 app = FastAPI(
     title="PrintGuard",
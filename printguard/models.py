@@ -145,6 +145,8 @@ class CameraState(BaseModel):
     majority_vote_window: int = None
     printer_id: Optional[str] = None
     printer_config: Optional[Dict] = None
+    last_printer_state: Optional[str] = Field(None, exclude=True)
+    last_printer_state_ts: Optional[float] = Field(None, exclude=True)
 
     def __init__(self, **data):
         if 'brightness' not in data:
@@ -228,6 +230,7 @@ class SavedConfig(str, Enum):
     STREAM_MAX_WIDTH = "stream_max_width"
     DETECTION_INTERVAL_MS = "detection_interval_ms"
     PRINTER_STAT_POLLING_RATE_MS = "printer_stat_polling_rate_ms"
+    PRINTER_RESPONSE_CACHE_TTL_MS = "printer_response_cache_ttl_ms"
     MIN_SSE_DISPATCH_DELAY_MS = "min_sse_dispatch_delay_ms"
     PUSH_SUBSCRIPTIONS = "push_subscriptions"
     CAMERA_STATES = "camera_states"
@@ -30,7 +30,7 @@ async def alert_response(request: Request,
         case AlertAction.DISMISS:
             response = await dismiss_alert(alert_id)
         case AlertAction.CANCEL_PRINT | AlertAction.PAUSE_PRINT:
-            suspend_print_job(camera_uuid, action)
+            await suspend_print_job(camera_uuid, action)
             return await dismiss_alert(alert_id)
     if not response:
         response = {"message": f"Alert {alert_id} not found."}
@@ -3,9 +3,8 @@ import logging
 from fastapi import APIRouter, HTTPException
 
 from ..models import PrinterConfigRequest, AlertAction
-from ..utils.printer_services.octoprint import OctoPrintClient
-from ..utils.printer_utils import (get_printer_id, remove_printer,
-                                   set_printer, suspend_print_job)
+from ..utils.printer_utils import (get_printer_client_class, get_printer_id,
+                                   remove_printer, set_printer, suspend_print_job)
 from ..utils.camera_utils import get_camera_state
 
 router = APIRouter()
@@ -26,8 +25,12 @@ async def add_printer_ep(camera_uuid: str, printer_config: PrinterConfigRequest)
         HTTPException: If printer connection test fails or configuration is invalid.
     """
     try:
-        client = OctoPrintClient(printer_config.base_url, printer_config.api_key)
-        client.get_job_info()
+        client_class = get_printer_client_class(printer_config.printer_type)
+        client = client_class(printer_config.base_url, printer_config.api_key)
+        try:
+            await client.aget_job_info(validate=True)
+        finally:
+            client.close()
         printer_id = f"{camera_uuid}_{printer_config.name.replace(' ', '_')}"
         await set_printer(camera_uuid, printer_id, printer_config.model_dump())
         return {"success": True, "printer_id": printer_id}
@@ -71,7 +74,7 @@ async def cancel_print_job_ep(camera_uuid: str):
     Returns:
         dict: Success status and confirmation message.
     """
-    suspend_print_job(camera_uuid, AlertAction.CANCEL_PRINT)
+    await suspend_print_job(camera_uuid, AlertAction.CANCEL_PRINT)
     camera_state = await get_camera_state(camera_uuid)
     camera_nickname = camera_state.nickname if camera_state else camera_uuid
     return {"success": True, "message": f"Print job cancelled for camera {camera_nickname}"}
@@ -86,7 +89,7 @@ async def pause_print_job_ep(camera_uuid: str):
     Returns:
         dict: Success status and confirmation message.
     """
-    suspend_print_job(camera_uuid, AlertAction.PAUSE_PRINT)
+    await suspend_print_job(camera_uuid, AlertAction.PAUSE_PRINT)
     camera_state = await get_camera_state(camera_uuid)
     camera_nickname = camera_state.nickname if camera_state else camera_uuid
     return {"success": True, "message": f"Print job paused for camera {camera_nickname}"}
@@ -72,6 +72,17 @@ class CameraStateManager:
                 self._save_states_to_config()
             return self._states[camera_uuid]
 
+    def peek_camera_state(self, camera_uuid: str) -> Optional[CameraState]:
+        """Get the in-memory camera state without creating or persisting one.
+
+        Args:
+            camera_uuid (str): The UUID of the camera.
+
+        Returns:
+            Optional[CameraState]: The state of the camera, or None if unknown.
+        """
+        return self._states.get(camera_uuid)
+
     async def update_camera_state(self, camera_uuid: str,
                                   new_states: Dict) -> Optional[CameraState]:
         """Updates the state of a specific camera.
@@ -55,7 +55,7 @@ async def _terminate_alert_after_cooldown(alert):
             case AlertAction.DISMISS:
                 await dismiss_alert(alert.id)
             case AlertAction.CANCEL_PRINT | AlertAction.PAUSE_PRINT:
-                suspend_print_job(camera_uuid, camera_state.countdown_action)
+                await suspend_print_job(camera_uuid, camera_state.countdown_action)
                 return await dismiss_alert(alert.id)
 
 async def _create_alert_and_notify(camera_state_ref, camera_uuid, frame, timestamp_arg):
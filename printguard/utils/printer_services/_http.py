@@ -0,0 +1,32 @@
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# One pool per printer host is kept; each allows a few concurrent connections
+# so the poller and an alert action can talk to the same printer at once.
+POOL_CONNECTIONS = 16
+POOL_MAXSIZE = 4
+
+_shared_session: Optional[requests.Session] = None
+
+def get_shared_session() -> requests.Session:
+    """Get the process-wide keep-alive session shared by all printer clients."""
+    # pylint: disable=global-statement
+    global _shared_session
+    if _shared_session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS,
+                              pool_maxsize=POOL_MAXSIZE)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        _shared_session = session
+    return _shared_session
+
+def close_shared_session() -> None:
+    """Close the shared session, releasing every pooled printer connection."""
+    # pylint: disable=global-statement
+    global _shared_session
+    if _shared_session is not None:
+        _shared_session.close()
+        _shared_session = None
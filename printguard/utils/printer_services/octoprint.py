@@ -1,9 +1,52 @@
-from typing import Dict
-import requests
-from ...models import (FileInfo, JobInfoResponse,
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Callable, Dict, Mapping, Optional
+from ._http import get_shared_session
+from ...models import (FileInfo, JobInfoResponse, Progress,
                        TemperatureReadings, TemperatureReading,
                        PrinterState, PrinterTemperatures)
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# Worker pool used to overlap the independent /api/job request with the
+# /api/printer request issued from get_printer_state. Sized by the executor
+# default so concurrent pollers for several printers do not queue on it.
+_REQUEST_EXECUTOR = ThreadPoolExecutor(thread_name_prefix="octoprint")
+
+_ZERO_TEMPS = MappingProxyType({
+    "nozzle_actual": 0.0,
+    "nozzle_target": 0.0,
+    "bed_actual": 0.0,
+    "bed_target": 0.0,
+})
+
+def _extract_job_fields(data: dict) -> dict:
+    """Keep only the /api/job fields read by this client and the SSE payload."""
+    job = data.get("job") or {}
+    return {
+        "job": {"file": job.get("file")} if "file" in job else {},
+        "progress": data.get("progress"),
+        "state": data.get("state"),
+        "error": data.get("error"),
+    }
+
+def _extract_temperature_fields(data: dict) -> dict:
+    """Keep only the temperature section of an /api/printer response."""
+    return {"temperature": data.get("temperature") or {}}
+
+@dataclass
+class _CachedResponse:
+    """A decoded API response and the monotonic time it was fetched at."""
+    ts: float
+    json: Optional[dict]
 
 class OctoPrintClient:
     """
@@ -16,39 +59,131 @@ class OctoPrintClient:
     Attributes:
         base_url (str): The base URL of the OctoPrint instance
         headers (dict): HTTP headers including API key for authentication
+        session (requests.Session): Process-wide keep-alive session shared by all
+            printer clients; requests are told apart by URL and API key header
     """
     
-    def __init__(self, base_url: str, api_key: str):
+    def __init__(self, base_url: str, api_key: str, cache_ttl: float = 0.0):
         """
         Initialize the OctoPrint client.
         
         Args:
             base_url (str): The base URL of the OctoPrint instance (e.g., 'http://octopi.local')
             api_key (str): The API key for authentication with OctoPrint
+            cache_ttl (float): Seconds a GET response is reused for before the
+                endpoint is queried again. 0 disables caching.
         """
         self.base_url = base_url.rstrip("/")
         self.headers = {
             "X-Api-Key": api_key,
             "Content-Type": "application/json"
         }
+        self._ttl = cache_ttl
+        self._cache: Dict[str, _CachedResponse] = {}
+        self._last_job_info: Optional[JobInfoResponse] = None
+        self._last_job_info_ts = 0.0
+        self.session = get_shared_session()
+
+    def close(self) -> None:
+        """
+        Drop this client's cached responses.
+        
+        The shared HTTP session is left open for other printer clients; it is
+        closed on application shutdown via close_shared_session.
+        """
+        self._cache.clear()
+        self._last_job_info = None
 
-    def get_job_info(self) -> JobInfoResponse:
+    def _get(self, endpoint: str, params: Optional[dict] = None,
+             allow_conflict: bool = False,
+             extract: Optional[Callable[[dict], dict]] = None) -> Optional[dict]:
+        """
+        Issue a GET request against the API, reusing a recent response if cached.
+        
+        Args:
+            endpoint (str): The API path, e.g. '/api/job'
+            params (dict, optional): Query parameters for the request
+            allow_conflict (bool): Treat a 409 response as an empty (None) result
+                rather than an error
+            extract (Callable, optional): Picks the needed fields out of the
+                decoded body so only those are returned and retained in the cache
+        
+        Returns:
+            Optional[dict]: The decoded (and extracted) JSON body, or None for
+                an allowed 409.
+        
+        Raises:
+            requests.HTTPError: If the API request fails
+            requests.Timeout: If the request times out
+        """
+        cached = self._cache.get(endpoint)
+        if cached is not None and time.monotonic() - cached.ts < self._ttl:
+            return cached.json
+        resp = self.session.get(f"{self.base_url}{endpoint}",
+                                headers=self.headers,
+                                params=params,
+                                timeout=10)
+        if allow_conflict and resp.status_code == 409:
+            data = None
+        else:
+            resp.raise_for_status()
+            data = _loads(resp.content)
+            if extract is not None:
+                data = extract(data)
+        if self._ttl > 0:
+            self._cache[endpoint] = _CachedResponse(ts=time.monotonic(), json=data)
+        return data
+
+    def get_job_info(self, validate: bool = False) -> JobInfoResponse:
         """
         Retrieve information about the current print job.
         
+        The response comes from printer firmware with a fixed schema, so by
+        default the models are built with model_construct to skip validation
+        on this polling path.
+        
+        Args:
+            validate (bool): Fully validate the response, e.g. when checking a
+                user-provided printer configuration
+        
         Returns:
-            JobInfoResponse: Complete job information including progress, file details,
-                           and print statistics
+            JobInfoResponse: Job information including progress, state and the
+                           details of the file being printed
             
         Raises:
             requests.HTTPError: If the API request fails
             requests.Timeout: If the request times out
+            pydantic.ValidationError: If validate is set and the response is
+                not a valid job information payload
         """
-        resp = requests.get(f"{self.base_url}/api/job",
-                            headers=self.headers,
-                            timeout=10)
-        resp.raise_for_status()
-        return JobInfoResponse(**resp.json())
+        data = self._get("/api/job", extract=_extract_job_fields)
+        if validate:
+            return JobInfoResponse.model_validate(data)
+        progress = data.get("progress")
+        job_info = JobInfoResponse.model_construct(
+            job=data.get("job") or {},
+            progress=Progress.model_construct(**progress) if progress else None,
+            state=data.get("state"),
+            error=data.get("error")
+        )
+        # Stamp with the fetch time of the underlying response so a cache hit
+        # does not extend how long this job information counts as fresh.
+        cached = self._cache.get("/api/job")
+        self._last_job_info = job_info
+        self._last_job_info_ts = cached.ts if cached else time.monotonic()
+        return job_info
+
+    def _recent_job_info(self) -> JobInfoResponse:
+        """
+        Return the last job information if still within the cache TTL, else refetch.
+        
+        Returns:
+            JobInfoResponse: Job information as returned by get_job_info.
+        """
+        if (self._last_job_info is not None
+                and time.monotonic() - self._last_job_info_ts < self._ttl):
+            return self._last_job_info
+        return self.get_job_info()
 
     def cancel_job(self) -> None:
         """
@@ -61,12 +196,14 @@ class OctoPrintClient:
             requests.HTTPError: If the API request fails
             requests.Timeout: If the request times out
         """
-        resp = requests.post(
+        resp = self.session.post(
             f"{self.base_url}/api/job",
             headers=self.headers,
             timeout=10,
             json={"command": "cancel"}
         )
+        self._cache.clear()
+        self._last_job_info = None
         if resp.status_code == 204:
             return
         resp.raise_for_status()
@@ -82,16 +219,41 @@ class OctoPrintClient:
             requests.HTTPError: If the API request fails
             requests.Timeout: If the request times out
         """
-        resp = requests.post(
+        resp = self.session.post(
             f"{self.base_url}/api/job",
             headers=self.headers,
             timeout=10,
             json={"command": "pause"}
         )
+        self._cache.clear()
+        self._last_job_info = None
         if resp.status_code == 204:
             return
         resp.raise_for_status()
 
+    def _extract_raw_temps(self) -> Dict[str, dict]:
+        """
+        Retrieve the unvalidated temperature section of the printer status.
+        
+        Only the temperature section of the printer status is requested; the
+        SD card and state sections are excluded server-side since they are
+        never consumed here.
+        
+        Returns:
+            Dict[str, dict]: Dictionary mapping component names to their raw
+                           'actual'/'target'/'offset' readings. Returns empty
+                           dict if printer is not operational.
+            
+        Raises:
+            requests.HTTPError: If the API request fails (except for 409 conflicts)
+            requests.Timeout: If the request times out
+        """
+        data = self._get("/api/printer", params={"exclude": "sd,state"},
+                         allow_conflict=True, extract=_extract_temperature_fields)
+        if data is None:
+            return {}
+        return data.get("temperature") or {}
+
     def get_printer_temperatures(self) -> Dict[str, TemperatureReading]:
         """
         Retrieve current temperature readings from all printer components.
@@ -105,13 +267,10 @@ class OctoPrintClient:
             requests.HTTPError: If the API request fails (except for 409 conflicts)
             requests.Timeout: If the request times out
         """
-        resp = requests.get(f"{self.base_url}/api/printer",
-                            headers=self.headers,
-                            timeout=10)
-        if resp.status_code == 409:
+        raw_temps = self._extract_raw_temps()
+        if not raw_temps:
             return {}
-        resp.raise_for_status()
-        state = TemperatureReadings(**resp.json())
+        state = TemperatureReadings(temperature=raw_temps)
         return state.temperature
 
     def percent_complete(self) -> float:
@@ -125,7 +284,7 @@ class OctoPrintClient:
             requests.HTTPError: If the API request fails
             requests.Timeout: If the request times out
         """
-        return self.get_job_info().progress.completion * 100
+        return self._recent_job_info().progress.completion * 100
 
     def current_file(self) -> FileInfo:
         """
@@ -139,9 +298,9 @@ class OctoPrintClient:
             requests.HTTPError: If the API request fails
             requests.Timeout: If the request times out
         """
-        return self.get_job_info().job["file"]
+        return self._recent_job_info().job["file"]
 
-    def nozzle_and_bed_temps(self) -> Dict[str, float]:
+    def nozzle_and_bed_temps(self) -> Mapping[str, float]:
         """
         Get simplified temperature readings for nozzle and bed.
         
@@ -150,28 +309,24 @@ class OctoPrintClient:
         and heated bed.
         
         Returns:
-            Dict[str, float]: Dictionary with keys:
+            Mapping[str, float]: Mapping with keys:
                 - 'nozzle_actual': Current nozzle temperature
                 - 'nozzle_target': Target nozzle temperature  
                 - 'bed_actual': Current bed temperature
                 - 'bed_target': Target bed temperature
-                Returns 0.0 for all values if temperatures are unavailable.
+                Returns a shared read-only mapping of 0.0 values if
+                temperatures are unavailable.
         """
-        temps = self.get_printer_temperatures()
+        temps = self._extract_raw_temps()
         if not temps:
-            return {
-                "nozzle_actual": 0.0,
-                "nozzle_target": 0.0,
-                "bed_actual": 0.0,
-                "bed_target": 0.0,
-            }
-        tool0 = temps.get("tool0")
-        bed   = temps.get("bed")
+            return _ZERO_TEMPS
+        tool0 = temps.get("tool0") or {}
+        bed   = temps.get("bed") or {}
         return {
-            "nozzle_actual": tool0.actual if tool0 else 0.0,
-            "nozzle_target": tool0.target if tool0 else 0.0,
-            "bed_actual"   : bed.actual if bed else 0.0,
-            "bed_target"   : bed.target if bed else 0.0,
+            "nozzle_actual": tool0.get("actual", 0.0),
+            "nozzle_target": tool0.get("target", 0.0),
+            "bed_actual"   : bed.get("actual", 0.0),
+            "bed_target"   : bed.get("target", 0.0),
         }
 
     def get_printer_state(self) -> PrinterState:
@@ -190,22 +345,61 @@ class OctoPrintClient:
         Note:
             If job information retrieval fails, the jobInfoResponse field
             will be None, but temperature data will still be included if available.
+            The job and temperature requests are dispatched concurrently, so the
+            call takes roughly one round-trip rather than two.
         """
-        temperature_readings = self.get_printer_temperatures()
-        tool0_temp = temperature_readings.get("tool0") if temperature_readings else None
-        bed_temp = temperature_readings.get("bed") if temperature_readings else None
-        printer_temps: PrinterTemperatures = PrinterTemperatures(
-            nozzle_actual=tool0_temp.actual if tool0_temp else None,
-            nozzle_target=tool0_temp.target if tool0_temp else None,
-            bed_actual=bed_temp.actual if bed_temp else None,
-            bed_target=bed_temp.target if bed_temp else None
+        job_future = _REQUEST_EXECUTOR.submit(self.get_job_info)
+        raw_temps = self._extract_raw_temps()
+        tool0_temp = raw_temps.get("tool0") or {}
+        bed_temp = raw_temps.get("bed") or {}
+        printer_temps: PrinterTemperatures = PrinterTemperatures.model_construct(
+            nozzle_actual=tool0_temp.get("actual"),
+            nozzle_target=tool0_temp.get("target"),
+            bed_actual=bed_temp.get("actual"),
+            bed_target=bed_temp.get("target")
         )
         try:
-            job_info = self.get_job_info()
+            job_info = job_future.result()
         except Exception:
             job_info = None
-        printer_state = PrinterState(
+        printer_state = PrinterState.model_construct(
             jobInfoResponse=job_info,
             temperatureReading=printer_temps
         )
         return printer_state
+
+    async def aget_printer_state(self) -> PrinterState:
+        """
+        Get comprehensive printer state information without blocking the event loop.
+        
+        The blocking HTTP requests made by get_printer_state are run in a worker
+        thread, so pollers for different printers can overlap on one loop.
+        
+        Returns:
+            PrinterState: Complete printer state as returned by get_printer_state.
+        """
+        return await asyncio.to_thread(self.get_printer_state)
+
+    async def aget_job_info(self, validate: bool = False) -> JobInfoResponse:
+        """
+        Retrieve information about the current print job without blocking the event loop.
+        
+        Args:
+            validate (bool): Fully validate the response, as in get_job_info
+        
+        Returns:
+            JobInfoResponse: Job information as returned by get_job_info.
+        """
+        return await asyncio.to_thread(self.get_job_info, validate)
+
+    async def acancel_job(self) -> None:
+        """
+        Cancel the currently running print job without blocking the event loop.
+        """
+        await asyncio.to_thread(self.cancel_job)
+
+    async def apause_job(self) -> None:
+        """
+        Pause the currently running print job without blocking the event loop.
+        """
+        await asyncio.to_thread(self.pause_job)
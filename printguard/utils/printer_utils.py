@@ -1,13 +1,42 @@
 import asyncio
 import logging
+import time
 
 import requests
 
-from ..models import PollingTask, SavedConfig, AlertAction
+from ..models import PollingTask, PrinterType, SavedConfig, AlertAction
+from .camera_state_manager import get_camera_state_manager
 from .camera_utils import get_camera_state_sync, update_camera_state
 from .config import PRINTER_STAT_POLLING_RATE_MS, get_config
 from .printer_services.octoprint import OctoPrintClient
-from .sse_utils import add_polling_task, sse_update_printer_state
+from .sse_utils import (add_polling_task, sse_update_printer_state,
+                        stop_and_remove_polling_task)
+
+CLIENT_FACTORY = {
+    PrinterType.OCTOPRINT: OctoPrintClient,
+}
+# Keyed by the raw printer_type value so lookups skip building a PrinterType.
+# Configs saved without a printer_type fall back to OctoPrint.
+_STR_TO_CLIENT = {printer_type.value: client_class
+                  for printer_type, client_class in CLIENT_FACTORY.items()}
+_DEFAULT_CLIENT = _STR_TO_CLIENT[PrinterType.OCTOPRINT.value]
+
+_printer_clients = {}
+_polling_clients = {}
+_polling_interval = PRINTER_STAT_POLLING_RATE_MS / 1000
+_polling_supervisor = None
+_polls_in_flight = {}
+
+def get_printer_client_class(printer_type_str):
+    """Resolve the client class used to talk to a printer type.
+
+    Args:
+        printer_type_str (str or PrinterType): The configured printer type.
+
+    Returns:
+        type: The printer client class, defaulting to OctoPrintClient.
+    """
+    return _STR_TO_CLIENT.get(printer_type_str) or _DEFAULT_CLIENT
 
 def get_printer_config(camera_uuid):
     """Retrieve printer configuration from camera state.
@@ -30,6 +59,67 @@ def get_printer_config(camera_uuid):
         return camera_state.printer_config
     return None
 
+def get_printer_cache_ttl():
+    """Retrieve how long printer API responses may be reused, in seconds.
+
+    Defaults to a quarter of the configured polling rate, and is capped at half
+    of it so every polling tick still fetches fresh data.
+
+    Returns:
+        float: The response cache TTL in seconds.
+    """
+    config = get_config() or {}
+    polling_rate_ms = config.get(
+        SavedConfig.PRINTER_STAT_POLLING_RATE_MS, PRINTER_STAT_POLLING_RATE_MS)
+    cache_ttl_ms = config.get(
+        SavedConfig.PRINTER_RESPONSE_CACHE_TTL_MS, polling_rate_ms / 4)
+    return float(min(cache_ttl_ms, polling_rate_ms / 2) / 1000)
+
+def get_printer_client(camera_uuid):
+    """Retrieve the cached printer client for a camera, creating it on a miss.
+
+    Args:
+        camera_uuid (str): The UUID of the camera.
+
+    Returns:
+        OctoPrintClient or None: The printer client, or None if no printer is configured.
+    """
+    client = _printer_clients.get(camera_uuid)
+    if client is None:
+        printer_config = get_printer_config(camera_uuid)
+        if not printer_config:
+            return None
+        client_class = get_printer_client_class(printer_config.get('printer_type'))
+        client = client_class(
+            printer_config.get('base_url'),
+            printer_config.get('api_key'),
+            cache_ttl=get_printer_cache_ttl()
+        )
+        _printer_clients[camera_uuid] = client
+    return client
+
+def close_printer_client(camera_uuid):
+    """Evict and close the cached printer client for a camera, if any.
+
+    Args:
+        camera_uuid (str): The UUID of the camera.
+    """
+    client = _printer_clients.pop(camera_uuid, None)
+    if client:
+        client.close()
+
+def _forget_printer(camera_uuid):
+    """Drop the cached client and last polled state of a camera's printer.
+
+    Args:
+        camera_uuid (str): The UUID of the camera.
+    """
+    close_printer_client(camera_uuid)
+    camera_state = get_camera_state_manager().peek_camera_state(camera_uuid)
+    if camera_state:
+        camera_state.last_printer_state = None
+        camera_state.last_printer_state_ts = None
+
 def get_printer_id(camera_uuid):
     """Retrieve the printer ID associated with a camera.
 
@@ -55,10 +145,21 @@ async def set_printer(camera_uuid, printer_id, printer_config):
     Returns:
         Optional[CameraState]: The updated camera state, or None if failed.
     """
-    return await update_camera_state(camera_uuid, {
+    _forget_printer(camera_uuid)
+    camera_state = await update_camera_state(camera_uuid, {
         "printer_id": printer_id,
         "printer_config": printer_config
     })
+    polling_entry = _polling_clients.get(camera_uuid)
+    if polling_entry:
+        old_client, stop_event = polling_entry
+        old_client.close()
+        client = get_printer_client(camera_uuid)
+        if client:
+            _polling_clients[camera_uuid] = (client, stop_event)
+        else:
+            del _polling_clients[camera_uuid]
+    return camera_state
 
 async def remove_printer(camera_uuid):
     """Remove the printer association from a camera.
@@ -69,29 +170,110 @@ async def remove_printer(camera_uuid):
     Returns:
         Optional[CameraState]: The updated camera state, or None if failed.
     """
+    _forget_printer(camera_uuid)
+    polling_entry = _polling_clients.pop(camera_uuid, None)
+    if polling_entry:
+        polling_entry[0].close()
+        stop_and_remove_polling_task(camera_uuid)
     return await update_camera_state(camera_uuid, {
         "printer_id": None,
         "printer_config": None
     })
 
-async def poll_printer_state_func(client, interval, stop_event):
-    """Continuously poll the printer state and send updates via SSE.
+def _log_polling_error(camera_uuid, error):
+    """Log a failed printer state poll at a level matching its cause.
+
+    Args:
+        camera_uuid (str): The UUID of the camera whose poll failed.
+        error (BaseException): The exception raised by the poll.
+    """
+    if isinstance(error, (requests.exceptions.RequestException, ConnectionError,
+                          TimeoutError, ValueError)):
+        logging.warning("Error polling printer state for camera %s: %s",
+                        camera_uuid, str(error))
+    else:
+        logging.error("Unexpected error polling printer state for camera %s: %s",
+                      camera_uuid, str(error))
+
+def _record_printer_state(camera_uuid, printer_state):
+    """Stamp the latest polled job state onto the camera's in-memory state.
+
+    The stamped fields are excluded from persistence, so recording them does
+    not rewrite the config file on every polling tick. Cameras the state
+    manager no longer knows about are skipped rather than recreated.
+
+    Args:
+        camera_uuid (str): The UUID of the camera.
+        printer_state (PrinterState): The printer state returned by the poll.
+    """
+    job_info = printer_state.jobInfoResponse
+    if job_info is None:
+        return
+    camera_state = get_camera_state_manager().peek_camera_state(camera_uuid)
+    if camera_state is None:
+        return
+    camera_state.last_printer_state = job_info.state
+    camera_state.last_printer_state_ts = time.monotonic()
+
+async def _poll_printer(camera_uuid, client, stop_event):
+    """Poll one printer and send its state via SSE.
 
     Args:
+        camera_uuid (str): The UUID of the camera the printer belongs to.
         client (OctoPrintClient): The client to query printer status.
-        interval (float): Time in seconds between polls.
-        stop_event (asyncio.Event): An event to signal polling should stop.
+        stop_event (asyncio.Event): The camera's polling stop event.
     """
-    while not stop_event.is_set():
-        try:
-            current_printer_state = client.get_printer_state()
-            await sse_update_printer_state(current_printer_state)
-        except (requests.exceptions.RequestException, ConnectionError,
-                TimeoutError, ValueError) as e:
-            logging.warning("Error polling printer state: %s", str(e))
-        except Exception as e:
-            logging.error("Unexpected error polling printer state: %s", str(e))
-        await asyncio.sleep(interval)
+    try:
+        printer_state = await client.aget_printer_state()
+        # Skip results from a printer that was stopped or replaced mid-poll.
+        current = _polling_clients.get(camera_uuid)
+        if stop_event.is_set() or current is None or current[0] is not client:
+            return
+        _record_printer_state(camera_uuid, printer_state)
+        await sse_update_printer_state(printer_state)
+    except Exception as e:
+        _log_polling_error(camera_uuid, e)
+
+async def poll_printer_states_func():
+    """Dispatch a poll for every registered printer each tick.
+
+    A single task serves all cameras: on each tick, clients whose stop event
+    has been set are dropped and closed, then each remaining printer is polled
+    in its own task. A printer whose previous poll is still in flight is
+    skipped, so a slow or unreachable printer only delays its own camera's
+    updates. The task exits once no printers are left to poll.
+
+    Ticks are scheduled against absolute deadlines so request latency does not
+    stretch the polling period. If a tick overruns by more than one interval,
+    the schedule is reset rather than firing back-to-back catch-up polls.
+    """
+    loop = asyncio.get_running_loop()
+    next_tick = loop.time() + _polling_interval
+    while True:
+        for camera_uuid, (client, stop_event) in list(_polling_clients.items()):
+            if stop_event.is_set():
+                del _polling_clients[camera_uuid]
+                _polls_in_flight.pop(camera_uuid, None)
+                if _printer_clients.get(camera_uuid) is client:
+                    close_printer_client(camera_uuid)
+                else:
+                    client.close()
+        if not _polling_clients:
+            break
+        for camera_uuid, (client, stop_event) in _polling_clients.items():
+            in_flight = _polls_in_flight.get(camera_uuid)
+            if in_flight is not None and not in_flight.done():
+                continue
+            _polls_in_flight[camera_uuid] = asyncio.create_task(
+                _poll_printer(camera_uuid, client, stop_event))
+        delay = next_tick - loop.time()
+        next_tick += _polling_interval
+        if delay < -_polling_interval:
+            logging.warning("Printer polling fell behind by %.2fs, resetting schedule",
+                            -delay)
+            next_tick = loop.time() + _polling_interval
+        elif delay > 0:
+            await asyncio.sleep(delay)
 
 async def start_printer_state_polling(camera_uuid):
     """Start background polling of printer state for a camera.
@@ -99,24 +281,29 @@ async def start_printer_state_polling(camera_uuid):
     Args:
         camera_uuid (str): The UUID of the camera to poll.
     """
+    # pylint: disable=global-statement
+    global _polling_interval, _polling_supervisor
     stop_event = asyncio.Event()
-    camera_printer_config = get_printer_config(camera_uuid)
-    if not camera_printer_config:
+    client = get_printer_client(camera_uuid)
+    if not client:
         logging.warning("No printer configuration found for camera UUID %s", camera_uuid)
         return
     config = get_config()
-    printer_polling_rate = float(config.get(
+    _polling_interval = float(config.get(
         SavedConfig.PRINTER_STAT_POLLING_RATE_MS, PRINTER_STAT_POLLING_RATE_MS
         ) / 1000)
-    client = OctoPrintClient(
-        camera_printer_config.get('base_url'),
-        camera_printer_config.get('api_key')
-    )
-    task = asyncio.create_task(poll_printer_state_func(client, printer_polling_rate, stop_event))
-    add_polling_task(camera_uuid, PollingTask(task=task, stop_event=stop_event))
+    # The shared supervisor task is not stored on the PollingTask, so stopping
+    # one camera only sets its stop event rather than cancelling all polling.
+    add_polling_task(camera_uuid, PollingTask(stop_event=stop_event))
+    previous = _polling_clients.get(camera_uuid)
+    if previous and previous[0] is not client:
+        previous[0].close()
+    _polling_clients[camera_uuid] = (client, stop_event)
+    if _polling_supervisor is None or _polling_supervisor.done():
+        _polling_supervisor = asyncio.create_task(poll_printer_states_func())
     logging.debug("Started printer state polling for camera UUID %s", camera_uuid)
 
-def suspend_print_job(camera_uuid, action: AlertAction):
+async def suspend_print_job(camera_uuid, action: AlertAction):
     """Pause or cancel an ongoing print job based on an alert action.
 
     Args:
@@ -128,33 +315,35 @@ def suspend_print_job(camera_uuid, action: AlertAction):
     """
     printer_config = get_printer_config(camera_uuid)
     if printer_config:
-        if printer_config['printer_type'] == 'octoprint':
-            client = OctoPrintClient(
-                printer_config['base_url'],
-                printer_config['api_key']
-            )
-            try:
-                job_info = client.get_job_info()
-                if job_info.state != "Printing":
+        camera_state = get_camera_state_manager().peek_camera_state(camera_uuid)
+        last_state_ts = camera_state.last_printer_state_ts if camera_state else None
+        if (last_state_ts is not None
+                and time.monotonic() - last_state_ts < 2 * _polling_interval
+                and camera_state.last_printer_state != "Printing"):
+            return True
+        client = get_printer_client(camera_uuid)
+        try:
+            job_info = await client.aget_job_info()
+            if job_info.state != "Printing":
+                return True
+            match action:
+                case AlertAction.CANCEL_PRINT:
+                    await client.acancel_job()
+                    logging.debug("Print cancelled for printer %s on camera %s",
+                                    printer_config['name'], camera_uuid)
                     return True
-                match action:
-                    case AlertAction.CANCEL_PRINT:
-                        client.cancel_job()
-                        logging.debug("Print cancelled for printer %s on camera %s",
-                                        printer_config['name'], camera_uuid)
-                        return True
-                    case AlertAction.PAUSE_PRINT:
-                        client.pause_job()
-                        logging.debug("Print paused for printer %s on camera %s",
-                                        printer_config['name'], camera_uuid)
-                        return True
-                    case _:
-                        logging.debug("No action taken for printer %s on camera %s as %s",
-                                        printer_config['name'], camera_uuid, action)
-                        return True
-            except Exception as e:
-                logging.error("Error suspending print job for printer %s on camera %s: %s",
-                                printer_config['name'], camera_uuid, e)
-                return False
+                case AlertAction.PAUSE_PRINT:
+                    await client.apause_job()
+                    logging.debug("Print paused for printer %s on camera %s",
+                                    printer_config['name'], camera_uuid)
+                    return True
+                case _:
+                    logging.debug("No action taken for printer %s on camera %s as %s",
+                                    printer_config['name'], camera_uuid, action)
+                    return True
+        except Exception as e:
+            logging.error("Error suspending print job for printer %s on camera %s: %s",
+                            printer_config['name'], camera_uuid, e)
+            return False
     logging.error("No printer configuration found for camera UUID %s", camera_uuid)
     return False